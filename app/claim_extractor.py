@@ -6,20 +6,89 @@ Extracts verifiable claims with focus on detecting potential misinformation.
 import json
 import re
 import os
-from typing import List, Dict, Any
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import List, Dict, Any, Optional
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+from groq import APIConnectionError, InternalServerError, RateLimitError
 from langchain_groq import ChatGroq
 from langchain_core.messages import SystemMessage, HumanMessage
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
-from .prompts import CLAIM_EXTRACTION_SYSTEM_PROMPT, CLAIM_EXTRACTION_USER_PROMPT
+from .prompts import CLAIM_EXTRACTION_SYSTEM_PROMPT, build_claim_extraction_prompt
 
 
-def get_llm():
-    """Initialize the Groq LLM client - fast model."""
-    api_key = os.environ.get("GROQ_API_KEY")
-    if not api_key:
-        raise ValueError("GROQ_API_KEY environment variable is not set")
-    
+# Static prefix shared by every chunk request. Groq caches prompt prefixes
+# automatically, so keeping this (and the instructions at the top of the user
+# prompt) byte-identical lets every chunk after the first reuse it.
+EXTRACTION_SYSTEM_MESSAGE = SystemMessage(content=CLAIM_EXTRACTION_SYSTEM_PROMPT)
+
+# Regexes for pre-extracting numerical claims, compiled once at import
+NUMERIC_CLAIM_PATTERNS = [
+    # Percentages
+    (re.compile(r'(\d+(?:\.\d+)?%\s*(?:of|increase|decrease|growth|decline|rise|fall)[^.]*\.)', re.IGNORECASE), 'statistic'),
+    # Money amounts
+    (re.compile(r'(\$[\d,]+(?:\.\d+)?(?:\s*(?:billion|million|trillion))?[^.]*\.)', re.IGNORECASE), 'financial'),
+    # Years with context
+    (re.compile(r'((?:in|since|from|founded|established|started)\s*\d{4}[^.]*\.)', re.IGNORECASE), 'date'),
+    # Large numbers with context
+    (re.compile(r'(\d{1,3}(?:,\d{3})+(?:\s*(?:people|users|customers|employees|downloads))[^.]*\.)', re.IGNORECASE), 'statistic'),
+]
+
+DIGIT_RE = re.compile(r'\d')
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+NON_CLAIM_CHARS_RE = re.compile(r'[^\w\s\d%$.]')
+WHITESPACE_RE = re.compile(r'\s+')
+FENCED_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+def trigger_words(words: List[str]) -> str:
+    """
+    Alternation of words starting on a word boundary, so 'rate' doesn't fire
+    on 'accurate'. Words match whole (optionally plural); a trailing '*' also
+    allows any suffix ('profit*' matches 'profitable').
+    """
+    patterns = []
+    for word in words:
+        stem = re.escape(word.rstrip("*")).replace(r"\ ", r"\s+")
+        patterns.append(stem + r"\w*" if word.endswith("*") else stem + r"s?\b")
+    return r"\b(?:" + "|".join(patterns) + ")"
+
+
+# Claim type auto-detection triggers, in priority order. All types are matched
+# in a single scan; the zero-width lookahead is tried at every position so
+# overlapping triggers are not consumed by an earlier match.
+CLAIM_TYPE_TRIGGERS = [
+    ("financial", r"\$|" + trigger_words(['billion', 'million', 'revenue', 'profit*', 'stock*', 'market cap*', 'valuation'])),
+    ("statistic", "%|" + trigger_words(['percent*', 'ratio', 'rate'])),
+    ("date", YEAR_RE.pattern),
+    ("historical", trigger_words(['founded', 'established', 'started', 'launched'])),
+]
+CLAIM_TYPE_TRIGGER_RE = re.compile(
+    "(?=" + "|".join(f"(?P<{claim_type}>{pattern})" for claim_type, pattern in CLAIM_TYPE_TRIGGERS) + ")"
+)
+
+JSON_DECODER = json.JSONDecoder()
+
+# Groq errors worth retrying (timeouts/connection drops, 429s, 5xx); anything
+# else, e.g. a bad API key, fails fast.
+TRANSIENT_LLM_ERRORS = (APIConnectionError, InternalServerError, RateLimitError)
+
+# In-memory LRU of LLM extraction results, keyed by chunk content hash
+CHUNK_CACHE_SIZE = 256
+_chunk_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+_chunk_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _create_llm(api_key: str) -> ChatGroq:
+    """Build the Groq client once per API key so its HTTP pool is reused."""
     return ChatGroq(
         model="llama-3.1-8b-instant",
         api_key=api_key,
@@ -28,22 +97,58 @@ def get_llm():
     )
 
 
+def get_llm():
+    """Initialize the Groq LLM client - fast model."""
+    api_key = os.environ.get("GROQ_API_KEY")
+    if not api_key:
+        raise ValueError("GROQ_API_KEY environment variable is not set")
+    
+    return _create_llm(api_key)
+
+
+def split_oversized(para: str, max_chars: int) -> List[str]:
+    """Split a paragraph longer than max_chars at line/word breaks so no chunk exceeds the budget."""
+    pieces = []
+    while len(para) > max_chars:
+        cut = para.rfind('\n', 0, max_chars)
+        if cut <= 0:
+            cut = para.rfind(' ', 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        pieces.append(para[:cut])
+        para = para[cut:].lstrip()
+    pieces.append(para)
+    return pieces
+
+
 def chunk_text(text: str, max_chars: int = 5000) -> List[str]:
     """Split text into overlapping chunks for thorough analysis."""
-    paragraphs = text.split('\n\n')
+    # Keep every prompt within budget even when a page has no blank lines
+    paragraphs = [
+        piece
+        for para in text.split('\n\n')
+        for piece in (split_oversized(para, max_chars - 2) if len(para) > max_chars - 2 else (para,))
+    ]
     chunks = []
-    current_chunk = ""
+    current_paras = []
+    current_len = 0  # Length the chunk would have with "\n\n" after each paragraph
+    
+    def flush():
+        chunk = "\n\n".join(current_paras).strip()
+        if chunk:
+            chunks.append(chunk)
     
     for para in paragraphs:
-        if len(current_chunk) + len(para) + 2 <= max_chars:
-            current_chunk += para + "\n\n"
+        para_len = len(para) + 2
+        if current_len + para_len <= max_chars:
+            current_paras.append(para)
+            current_len += para_len
         else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = para + "\n\n"
+            flush()
+            current_paras = [para]
+            current_len = para_len
     
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    flush()
     
     return chunks if chunks else [text[:max_chars]]
 
@@ -53,23 +158,21 @@ def extract_numbers_and_stats(text: str) -> List[Dict[str, Any]]:
     Pre-extract numerical claims that the LLM might miss.
     This ensures we catch ALL statistics.
     """
-    claims = []
+    # Every pattern needs a digit, so skip the scans for digit-free text
+    if not DIGIT_RE.search(text):
+        return []
     
-    patterns = [
-        # Percentages
-        (r'(\d+(?:\.\d+)?%\s*(?:of|increase|decrease|growth|decline|rise|fall)[^.]*\.)', 'statistic'),
-        # Money amounts
-        (r'(\$[\d,]+(?:\.\d+)?(?:\s*(?:billion|million|trillion))?[^.]*\.)', 'financial'),
-        # Years with context
-        (r'((?:in|since|from|founded|established|started)\s*\d{4}[^.]*\.)', 'date'),
-        # Large numbers with context
-        (r'(\d{1,3}(?:,\d{3})+(?:\s*(?:people|users|customers|employees|downloads))[^.]*\.)', 'statistic'),
-    ]
+    claims = []
+    seen = set()
     
-    for pattern, claim_type in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern, claim_type in NUMERIC_CLAIM_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             if len(match) > 20:  # Filter out very short matches
+                key = normalize_claim(match)
+                if key in seen:
+                    continue
+                seen.add(key)
                 claims.append({
                     "claim": match.strip(),
                     "claim_type": claim_type,
@@ -81,96 +184,143 @@ def extract_numbers_and_stats(text: str) -> List[Dict[str, Any]]:
     return claims
 
 
-def extract_json_from_response(response_text: str) -> List[Dict[str, Any]]:
-    """Extract claims from LLM response with multiple parsing strategies."""
+def extract_json_from_response(response_text: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extract claims from LLM response in a single parsing pass.
+    Returns None if no JSON object could be parsed from the response.
+    """
     
-    # Strategy 1: Find ```json block
-    if "```json" in response_text:
+    # Strategy 1: Fenced ```json / ``` block
+    fenced = FENCED_JSON_RE.search(response_text)
+    if fenced:
         try:
-            json_str = response_text.split("```json")[1].split("```")[0]
-            data = json.loads(json_str.strip())
-            return data.get("claims", [])
-        except (json.JSONDecodeError, IndexError):
+            return json_loads(fenced.group(1)).get("claims", [])
+        except json.JSONDecodeError:
             pass
     
-    # Strategy 2: Find ``` block
-    if "```" in response_text:
+    # Strategy 2: Decode the first JSON object, ignoring any surrounding prose
+    start = response_text.find('{')
+    if start != -1:
+        try:
+            return json_loads(response_text[start:response_text.rfind('}') + 1]).get("claims", [])
+        except json.JSONDecodeError:
+            pass
+        
+        # Trailing text contains braces too - decode just the leading object
         try:
-            json_str = response_text.split("```")[1].split("```")[0]
-            data = json.loads(json_str.strip())
+            data, _ = JSON_DECODER.raw_decode(response_text, start)
             return data.get("claims", [])
-        except (json.JSONDecodeError, IndexError):
+        except json.JSONDecodeError:
             pass
     
-    # Strategy 3: Find JSON object
-    try:
-        start = response_text.find('{')
-        if start != -1:
-            brace_count = 0
-            for i, char in enumerate(response_text[start:], start):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        data = json.loads(response_text[start:i+1])
-                        return data.get("claims", [])
-    except json.JSONDecodeError:
-        pass
-    
-    # Strategy 4: Try whole response
-    try:
-        data = json.loads(response_text.strip())
-        return data.get("claims", [])
-    except json.JSONDecodeError:
-        pass
-    
-    return []
-
-
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-def extract_claims_from_chunk(llm: ChatGroq, chunk: str) -> List[Dict[str, Any]]:
-    """Extract claims from a single text chunk."""
+    return None
+
+
+def stream_json_response(llm: ChatGroq, messages: list) -> str:
+    """
+    Stream the LLM response and stop as soon as the first top-level JSON
+    object closes, so we don't wait on any trailing text the model adds.
+    """
+    parts = []
+    depth = 0
+    started = False
+    in_string = False
+    escaped = False
+    
+    for piece in llm.stream(messages):
+        parts.append(piece.content)
+        for char in piece.content:
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '{':
+                depth += 1
+                started = True
+            elif not started:
+                continue
+            elif char == '"':
+                in_string = True
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return "".join(parts).strip()
+    
+    return "".join(parts).strip()
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.5, min=0.2, max=5),
+    retry=retry_if_exception_type(TRANSIENT_LLM_ERRORS)
+)
+def extract_claims_from_chunk(llm: ChatGroq, chunk: str) -> Optional[List[Dict[str, Any]]]:
+    """Extract claims from a single text chunk (None if the reply was unparseable)."""
     messages = [
-        SystemMessage(content=CLAIM_EXTRACTION_SYSTEM_PROMPT),
-        HumanMessage(content=CLAIM_EXTRACTION_USER_PROMPT.format(text=chunk))
+        EXTRACTION_SYSTEM_MESSAGE,
+        HumanMessage(content=build_claim_extraction_prompt(text=chunk))
     ]
     
-    response = llm.invoke(messages)
-    response_text = response.content.strip()
+    response_text = stream_json_response(llm, messages)
     
     return extract_json_from_response(response_text)
 
 
+def extract_claims_from_chunk_cached(llm: ChatGroq, chunk: str) -> List[Dict[str, Any]]:
+    """
+    Extract claims from a chunk, reusing earlier results for identical text.
+    Returns fresh dict copies since later pipeline steps mutate claims in place.
+    """
+    key = hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).hexdigest()
+    
+    with _chunk_cache_lock:
+        cached = _chunk_cache.get(key)
+        if cached is not None:
+            _chunk_cache.move_to_end(key)
+            return [dict(c) for c in cached]
+    
+    claims = extract_claims_from_chunk(llm, chunk)
+    
+    # Don't cache unparseable replies, so a re-run can still recover the chunk
+    if claims is None:
+        return []
+    
+    with _chunk_cache_lock:
+        _chunk_cache[key] = claims
+        if len(_chunk_cache) > CHUNK_CACHE_SIZE:
+            _chunk_cache.popitem(last=False)
+    
+    return [dict(c) for c in claims]
+
+
 def normalize_claim(text: str) -> str:
     """Normalize claim text for comparison."""
     text = text.lower().strip()
-    text = re.sub(r'[^\w\s\d%$.]', '', text)
-    text = re.sub(r'\s+', ' ', text)
+    text = NON_CLAIM_CHARS_RE.sub('', text)
+    text = WHITESPACE_RE.sub(' ', text)
     return text
 
 
-def claims_are_similar(claim1: str, claim2: str, threshold: float = 0.7) -> bool:
-    """Check if two claims are similar based on word overlap."""
-    words1 = set(normalize_claim(claim1).split())
-    words2 = set(normalize_claim(claim2).split())
-    
-    if not words1 or not words2:
-        return False
-    
-    intersection = len(words1 & words2)
-    union = len(words1 | words2)
-    
-    similarity = intersection / union if union > 0 else 0
-    return similarity >= threshold
+def claim_words(text: str) -> frozenset:
+    """Get the normalized word set used for claim similarity."""
+    return frozenset(normalize_claim(text).split())
 
 
-def deduplicate_claims(claims: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Remove duplicate or very similar claims."""
+def deduplicate_claims(claims: List[Dict[str, Any]], threshold: float = 0.7) -> List[Dict[str, Any]]:
+    """
+    Remove duplicate or very similar claims.
+    Uses a word -> kept-claim index: counting index hits gives the word overlap
+    with every kept claim sharing a word, so no pairwise set ops are needed.
+    """
     if not claims:
         return []
     
     unique = []
+    unique_sizes = []  # Word count of each kept claim
+    word_index: Dict[str, List[int]] = {}
     
     for claim in claims:
         claim_text = claim.get("claim", "").strip()
@@ -178,15 +328,20 @@ def deduplicate_claims(claims: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         if not claim_text or len(claim_text) < 15:
             continue
         
-        is_duplicate = False
-        for existing in unique:
-            existing_text = existing.get("claim", "")
-            if claims_are_similar(claim_text, existing_text):
-                is_duplicate = True
-                break
+        words = claim_words(claim_text)
+        size = len(words)
+        
+        overlaps = Counter(chain.from_iterable(word_index.get(word, ()) for word in words))
+        is_duplicate = any(
+            shared / (size + unique_sizes[idx] - shared) >= threshold
+            for idx, shared in overlaps.items()
+        )
         
         if not is_duplicate:
+            for word in words:
+                word_index.setdefault(word, []).append(len(unique))
             unique.append(claim)
+            unique_sizes.append(size)
     
     return unique
 
@@ -197,16 +352,11 @@ def categorize_claim(claim: Dict[str, Any]) -> Dict[str, Any]:
     
     # Auto-detect claim type if not set
     if not claim.get("claim_type") or claim.get("claim_type") == "unknown":
-        if any(word in claim_text for word in ['$', 'billion', 'million', 'revenue', 'profit', 'stock', 'market cap', 'valuation']):
-            claim["claim_type"] = "financial"
-        elif any(word in claim_text for word in ['%', 'percent', 'ratio', 'rate']):
-            claim["claim_type"] = "statistic"
-        elif re.search(r'\b(19|20)\d{2}\b', claim_text):
-            claim["claim_type"] = "date"
-        elif any(word in claim_text for word in ['founded', 'established', 'started', 'launched']):
-            claim["claim_type"] = "historical"
-        else:
-            claim["claim_type"] = "general"
+        hits = {match.lastgroup for match in CLAIM_TYPE_TRIGGER_RE.finditer(claim_text)}
+        claim["claim_type"] = next(
+            (claim_type for claim_type, _ in CLAIM_TYPE_TRIGGERS if claim_type in hits),
+            "general"
+        )
     
     # Generate search query if not present
     if not claim.get("search_query"):
@@ -233,19 +383,29 @@ def extract_claims(text: str, progress_callback=None) -> List[Dict[str, Any]]:
     regex_claims = extract_numbers_and_stats(text)
     all_claims.extend(regex_claims)
     
-    # Step 2: LLM-based extraction from chunks
+    # Step 2: LLM-based extraction from chunks (in parallel - calls are network-bound)
     chunks = chunk_text(text)
+    chunk_claims = [[] for _ in chunks]
+    
+    if progress_callback:
+        progress_callback(f"Analyzing {len(chunks)} section(s)...")
     
-    for i, chunk in enumerate(chunks):
-        if progress_callback:
-            progress_callback(f"Analyzing section {i+1}/{len(chunks)}...")
+    with ThreadPoolExecutor(max_workers=min(len(chunks), 8)) as executor:
+        futures = {executor.submit(extract_claims_from_chunk_cached, llm, chunk): i for i, chunk in enumerate(chunks)}
         
-        try:
-            llm_claims = extract_claims_from_chunk(llm, chunk)
-            all_claims.extend(llm_claims)
-        except Exception as e:
-            print(f"Error extracting from chunk {i+1}: {e}")
-            continue
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                chunk_claims[i] = future.result()
+            except Exception as e:
+                print(f"Error extracting from chunk {i+1}: {e}")
+            
+            if progress_callback:
+                progress_callback(f"Analyzed section {done}/{len(chunks)}...")
+    
+    # Keep document order regardless of completion order
+    for claims in chunk_claims:
+        all_claims.extend(claims)
     
     # Step 3: Categorize and validate claims
     categorized_claims = [categorize_claim(c) for c in all_claims]
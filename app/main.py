@@ -4,9 +4,11 @@ Main Streamlit Application
 """
 
 import streamlit as st
+import html
+import json
 import os
 import sys
-from io import BytesIO
+from urllib.parse import urlsplit
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,9 +17,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if "GROQ_API_KEY" in st.secrets:
     os.environ["GROQ_API_KEY"] = st.secrets["GROQ_API_KEY"]
 
-from app.pdf_parser import extract_text_from_pdf, get_pdf_metadata
-from app.claim_extractor import extract_claims
-from app.verifier import verify_claims, get_summary_stats
+# pdf_parser, claim_extractor and verifier pull in PDF, LangChain and search
+# libraries; they are imported where first used so the upload page renders
+# before those load
+from app.styles import APP_CSS
 
 # Page configuration
 st.set_page_config(
@@ -27,280 +30,46 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for styling
-st.markdown("""
-<style>
-    /* Main theme colors */
-    :root {
-        --verified-color: #10b981;
-        --inaccurate-color: #f59e0b;
-        --false-color: #ef4444;
-        --bg-dark: #0f172a;
-        --bg-card: #1e293b;
-        --text-primary: #f8fafc;
-        --text-secondary: #94a3b8;
-    }
-    
-    /* Hide default Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Main container styling */
-    .main .block-container {
-        padding-top: 2rem;
-        max-width: 1200px;
-    }
-    
-    /* Header styling */
-    .main-header {
-        text-align: center;
-        padding: 2rem 0;
-        background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
-        border-radius: 16px;
-        margin-bottom: 2rem;
-        border: 1px solid #334155;
-    }
-    
-    .main-header h1 {
-        color: #f8fafc;
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-    }
-    
-    .main-header p {
-        color: #94a3b8;
-        font-size: 1.1rem;
-    }
-    
-    /* Upload area styling */
-    .upload-area {
-        border: 2px dashed #475569;
-        border-radius: 12px;
-        padding: 3rem 2rem;
-        text-align: center;
-        background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);
-        transition: all 0.3s ease;
-    }
-    
-    .upload-area:hover {
-        border-color: #6366f1;
-        background: linear-gradient(180deg, #1e293b 0%, #1e1b4b 100%);
-    }
-    
-    /* Stats cards */
-    .stats-container {
-        display: flex;
-        gap: 1rem;
-        margin: 1.5rem 0;
-    }
-    
-    .stat-card {
-        flex: 1;
-        padding: 1.5rem;
-        border-radius: 12px;
-        text-align: center;
-        border: 1px solid #334155;
-    }
-    
-    .stat-card.verified {
-        background: linear-gradient(135deg, #064e3b 0%, #0f172a 100%);
-        border-color: #10b981;
-    }
-    
-    .stat-card.inaccurate {
-        background: linear-gradient(135deg, #78350f 0%, #0f172a 100%);
-        border-color: #f59e0b;
-    }
-    
-    .stat-card.false {
-        background: linear-gradient(135deg, #7f1d1d 0%, #0f172a 100%);
-        border-color: #ef4444;
-    }
-    
-    .stat-number {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin-bottom: 0.25rem;
-    }
-    
-    .stat-label {
-        color: #94a3b8;
-        font-size: 0.9rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    /* Claim cards */
-    .claim-card {
-        background: #1e293b;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-        border-left: 4px solid;
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-    }
-    
-    .claim-card:hover {
-        transform: translateX(4px);
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-    }
-    
-    .claim-card.verified {
-        border-left-color: #10b981;
-    }
-    
-    .claim-card.inaccurate {
-        border-left-color: #f59e0b;
-    }
-    
-    .claim-card.false {
-        border-left-color: #ef4444;
-    }
-    
-    .claim-text {
-        font-size: 1.1rem;
-        color: #f8fafc;
-        margin-bottom: 1rem;
-        line-height: 1.6;
-    }
-    
-    .claim-meta {
-        display: flex;
-        gap: 0.5rem;
-        flex-wrap: wrap;
-        margin-bottom: 1rem;
-    }
-    
-    .claim-tag {
-        padding: 0.25rem 0.75rem;
-        border-radius: 9999px;
-        font-size: 0.75rem;
-        font-weight: 500;
-        text-transform: uppercase;
-    }
-    
-    .tag-verified {
-        background: rgba(16, 185, 129, 0.2);
-        color: #10b981;
-    }
-    
-    .tag-inaccurate {
-        background: rgba(245, 158, 11, 0.2);
-        color: #f59e0b;
-    }
-    
-    .tag-false {
-        background: rgba(239, 68, 68, 0.2);
-        color: #ef4444;
-    }
-    
-    .tag-type {
-        background: rgba(99, 102, 241, 0.2);
-        color: #818cf8;
-    }
-    
-    .explanation-box {
-        background: #0f172a;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 1rem 0;
-        border: 1px solid #334155;
-    }
-    
-    .explanation-title {
-        color: #94a3b8;
-        font-size: 0.8rem;
-        text-transform: uppercase;
-        margin-bottom: 0.5rem;
-        letter-spacing: 0.05em;
-    }
-    
-    .explanation-text {
-        color: #e2e8f0;
-        line-height: 1.6;
-    }
-    
-    .correct-value {
-        background: rgba(245, 158, 11, 0.1);
-        border: 1px solid #f59e0b;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    .correct-value-label {
-        color: #f59e0b;
-        font-size: 0.8rem;
-        text-transform: uppercase;
-        margin-bottom: 0.25rem;
-    }
-    
-    .correct-value-text {
-        color: #fef3c7;
-        font-weight: 600;
-    }
-    
-    .sources-list {
-        margin-top: 1rem;
-    }
-    
-    .source-item {
-        display: flex;
-        align-items: flex-start;
-        gap: 0.5rem;
-        padding: 0.5rem 0;
-        border-bottom: 1px solid #334155;
-    }
-    
-    .source-item:last-child {
-        border-bottom: none;
-    }
-    
-    .source-link {
-        color: #60a5fa;
-        text-decoration: none;
-        font-size: 0.9rem;
-    }
-    
-    .source-link:hover {
-        color: #93c5fd;
-        text-decoration: underline;
-    }
-    
-    /* Processing indicator */
-    .processing-container {
-        text-align: center;
-        padding: 3rem;
-    }
-    
-    .stProgress > div > div {
-        background-color: #6366f1;
-    }
-    
-    /* Sidebar styling */
-    .sidebar .sidebar-content {
-        background: #0f172a;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #6366f1 0%, #4f46e5 100%);
-        color: white;
-        border: none;
-        padding: 0.75rem 2rem;
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #818cf8 0%, #6366f1 100%);
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(99, 102, 241, 0.4);
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for styling. Streamlit drops any element not emitted on a rerun,
+# so the (imported, prebuilt) stylesheet is still injected on every run.
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+
+# Claim cards rendered per results tab page
+CLAIMS_PER_PAGE = 20
+
+# Status -> (emoji, CSS class); unknown statuses render as false
+STATUS_META = {
+    "verified": ("🟢", "verified"),
+    "inaccurate": ("🟡", "inaccurate"),
+    "false": ("🔴", "false"),
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_pdf(pdf_bytes: bytes):
+    """Parse PDF metadata and text in one pass, cached by file content across reruns."""
+    from app.pdf_parser import parse_pdf
+    return parse_pdf(pdf_bytes)
+
+
+def run_verification(claims: list, progress_callback=None) -> list:
+    """
+    Verify claims in input order. Not st.cache_data: verification reports
+    progress to widgets, which cache_data would try to replay on a hit. The
+    verifier caches searches and verdicts itself, so re-runs stay cheap.
+    """
+    from app.verifier import verify_claims
+    return verify_claims(claims, progress_callback=progress_callback)
+
+
+def bucket_by_status(results: list) -> dict:
+    """Group claims by status in one pass (unknown statuses count as false, as in the stats)."""
+    buckets = {"verified": [], "inaccurate": [], "false": []}
+    for claim in results:
+        status = claim.get("status", "").lower()
+        buckets[status if status in buckets else "false"].append(claim)
+    return buckets
 
 
 def render_header():
@@ -350,12 +119,26 @@ def render_stats(stats: dict):
         """, unsafe_allow_html=True)
 
 
-def render_claim_card(claim: dict, index: int):
-    """Render a single claim card with expandable details."""
+def text_html(value) -> str:
+    """
+    Escape PDF/LLM text for unsafe_allow_html markup. Newlines become <br>: a
+    blank line would otherwise end the markdown HTML block mid-card.
+    """
+    return html.escape(str(value)).replace("\r\n", "\n").replace("\n", "<br>")
+
+
+def is_web_url(url: str) -> bool:
+    """Only http(s) links are rendered, so e.g. javascript: URLs can't become clickable."""
+    try:
+        return urlsplit(url.strip()).scheme.lower() in ("http", "https")
+    except ValueError:
+        return False
+
+
+def claim_card_html(claim: dict) -> str:
+    """Build a single claim card as a collapsible <details> block."""
     status = claim.get("status", "false").lower()
-    status_emoji = {"verified": "🟢", "inaccurate": "🟡", "false": "🔴"}.get(status, "🔴")
-    status_class = status if status in ["verified", "inaccurate", "false"] else "false"
-    tag_class = f"tag-{status_class}"
+    status_emoji, status_class = STATUS_META.get(status, STATUS_META["false"])
     
     # Add special indicators for myths and outdated
     is_myth = claim.get("is_myth", False)
@@ -366,75 +149,105 @@ def render_claim_card(claim: dict, index: int):
     elif is_outdated:
         special_indicator = "📅 OUTDATED: "
     
-    with st.expander(f"{status_emoji} {special_indicator}{claim.get('claim', 'Unknown claim')[:100]}...", expanded=False):
-        # Claim text
-        st.markdown(f"""
-        <div class="claim-text">{claim.get('claim', 'Unknown claim')}</div>
-        """, unsafe_allow_html=True)
-        
-        # Status and type tags
-        claim_type = claim.get("claim_type", "unknown")
-        confidence = claim.get("confidence", "low")
-        
-        tags_html = f"""
-        <div class="claim-meta">
-            <span class="claim-tag {tag_class}">{status.upper()}</span>
-            <span class="claim-tag tag-type">{claim_type}</span>
-            <span class="claim-tag tag-type">Confidence: {confidence}</span>
-        """
-        
-        # Add myth/outdated tags
-        if is_myth:
-            tags_html += '<span class="claim-tag tag-false">🚫 MYTH DETECTED</span>'
-        if is_outdated:
-            tags_html += '<span class="claim-tag tag-inaccurate">📅 OUTDATED DATA</span>'
-        
-        tags_html += "</div>"
-        st.markdown(tags_html, unsafe_allow_html=True)
-        
-        # Warning box for myths
-        if is_myth:
-            st.markdown("""
-            <div style="background: rgba(239, 68, 68, 0.1); border: 1px solid #ef4444; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
-                <strong style="color: #ef4444;">⚠️ This is a widely circulated myth that has been debunked.</strong>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Warning box for outdated data
-        if is_outdated:
-            st.markdown("""
-            <div style="background: rgba(245, 158, 11, 0.1); border: 1px solid #f59e0b; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
-                <strong style="color: #f59e0b;">⏰ This data appears to be outdated. Check below for current values.</strong>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Explanation
-        explanation = claim.get("explanation", "No explanation available")
-        st.markdown(f"""
-        <div class="explanation-box">
-            <div class="explanation-title">📋 Reasoning</div>
-            <div class="explanation-text">{explanation}</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Correct value (if inaccurate or outdated)
-        correct_value = claim.get("correct_value")
-        if correct_value:
-            st.markdown(f"""
-            <div class="correct-value">
-                <div class="correct-value-label">✅ Correct/Current Value</div>
-                <div class="correct-value-text">{correct_value}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Sources
-        sources = claim.get("sources", [])
-        if sources:
-            st.markdown("<div class='sources-list'><div class='explanation-title'>🔗 Sources</div>", unsafe_allow_html=True)
-            for i, source in enumerate(sources[:3], 1):
-                title = source.get("title", f"Source {i}")
-                url = source.get("url", "#")
-                st.markdown(f"**{i}.** [{title}]({url})", unsafe_allow_html=True)
+    claim_text = claim.get('claim', 'Unknown claim')
+    # Claim, explanation and values come from the PDF/LLM - escape before
+    # embedding them in unsafe_allow_html markup
+    claim_type = html.escape(str(claim.get("claim_type", "unknown")))
+    confidence = html.escape(str(claim.get("confidence", "low")))
+    
+    # Fragments carry no leading indentation, which markdown would otherwise
+    # render as a code block
+    parts = [
+        f'<details class="claim-card {status_class}">',
+        f'<summary>{status_emoji} {special_indicator}{html.escape(" ".join(claim_text[:100].split()))}...</summary>',
+        f'<div class="claim-text">{text_html(claim_text)}</div>',
+        '<div class="claim-meta">',
+        f'<span class="claim-tag tag-{status_class}">{html.escape(status.upper())}</span>',
+        f'<span class="claim-tag tag-type">{claim_type}</span>',
+        f'<span class="claim-tag tag-type">Confidence: {confidence}</span>',
+    ]
+    
+    # Add myth/outdated tags
+    if is_myth:
+        parts.append('<span class="claim-tag tag-false">🚫 MYTH DETECTED</span>')
+    if is_outdated:
+        parts.append('<span class="claim-tag tag-inaccurate">📅 OUTDATED DATA</span>')
+    parts.append('</div>')
+    
+    # Warning box for myths
+    if is_myth:
+        parts.append(
+            '<div style="background: rgba(239, 68, 68, 0.1); border: 1px solid #ef4444; border-radius: 8px; padding: 1rem; margin: 1rem 0;">'
+            '<strong style="color: #ef4444;">⚠️ This is a widely circulated myth that has been debunked.</strong>'
+            '</div>'
+        )
+    
+    # Warning box for outdated data
+    if is_outdated:
+        parts.append(
+            '<div style="background: rgba(245, 158, 11, 0.1); border: 1px solid #f59e0b; border-radius: 8px; padding: 1rem; margin: 1rem 0;">'
+            '<strong style="color: #f59e0b;">⏰ This data appears to be outdated. Check below for current values.</strong>'
+            '</div>'
+        )
+    
+    # Explanation
+    explanation = text_html(claim.get("explanation", "No explanation available"))
+    parts.append(
+        '<div class="explanation-box">'
+        '<div class="explanation-title">📋 Reasoning</div>'
+        f'<div class="explanation-text">{explanation}</div>'
+        '</div>'
+    )
+    
+    # Correct value (if inaccurate or outdated)
+    correct_value = claim.get("correct_value")
+    if correct_value:
+        parts.append(
+            '<div class="correct-value">'
+            '<div class="correct-value-label">✅ Correct/Current Value</div>'
+            f'<div class="correct-value-text">{text_html(correct_value)}</div>'
+            '</div>'
+        )
+    
+    # Sources
+    sources = claim.get("sources", [])
+    if sources:
+        parts.append("<div class='sources-list'><div class='explanation-title'>🔗 Sources</div>")
+        for i, source in enumerate(sources[:3], 1):
+            # The LLM may send null or non-string fields, so don't rely on .get defaults
+            title = text_html(source.get("title") or f"Source {i}")
+            url = str(source.get("url") or "")
+            if is_web_url(url):
+                link = f'<a class="source-link" href="{html.escape(url)}" target="_blank">{title}</a>'
+            else:
+                link = title
+            parts.append(f'<div class="source-item"><strong>{i}.</strong> {link}</div>')
+        parts.append("</div>")
+    
+    parts.append("</details>")
+    return "".join(parts)
+
+
+def render_claim_list(claims: list, key: str):
+    """
+    Render one page of claim cards. The cards are native <details> elements
+    sent in a single st.markdown call rather than one st.expander each.
+    """
+    total_pages = -(-len(claims) // CLAIMS_PER_PAGE)
+    page = 1
+    if total_pages > 1:
+        page = st.number_input(
+            f"Page (of {total_pages})",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1,
+            key=f"page_{key}"
+        )
+    
+    start = (page - 1) * CLAIMS_PER_PAGE
+    cards = [claim_card_html(claim) for claim in claims[start:start + CLAIMS_PER_PAGE]]
+    st.markdown("".join(cards), unsafe_allow_html=True)
 
 
 def main():
@@ -481,18 +294,40 @@ def main():
     )
     
     if uploaded_file is not None:
+        # Parse only when a new file is uploaded - reruns reuse the parsed
+        # result instead of copying and re-hashing the PDF bytes. file_id
+        # changes on every upload, unlike name/size, which can collide.
+        file_key = uploaded_file.file_id
+        if st.session_state.get("pdf_key") != file_key:
+            st.session_state.pdf_key = file_key
+            st.session_state.results = None
+            name = uploaded_file.name
+            st.session_state.display_name = name if len(name) <= 30 else name[:30] + "..."
+            try:
+                st.session_state.pdf_data = load_pdf(uploaded_file.getvalue())
+                st.session_state.pdf_error = None
+            except ValueError as e:
+                st.session_state.pdf_data = None
+                st.session_state.pdf_error = str(e)
+        
+        if st.session_state.pdf_error:
+            st.error(f"❌ {st.session_state.pdf_error}")
+            return
+        
         # Show file info
-        file_bytes = BytesIO(uploaded_file.read())
-        metadata = get_pdf_metadata(file_bytes)
-        file_bytes.seek(0)
+        metadata, text = st.session_state.pdf_data
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("📄 File", uploaded_file.name[:30] + "..." if len(uploaded_file.name) > 30 else uploaded_file.name)
+            st.metric("📄 File", st.session_state.display_name)
         with col2:
             st.metric("📑 Pages", metadata.get("pages", "Unknown"))
         with col3:
-            st.metric("📦 Size", f"{len(file_bytes.getvalue()) / 1024:.1f} KB")
+            st.metric("📦 Size", f"{uploaded_file.size / 1024:.1f} KB")
+        
+        scanned_pages = metadata["pages"] - metadata["text_pages"]
+        if scanned_pages > 0:
+            st.warning(f"⚠️ {scanned_pages}/{metadata['pages']} pages have no extractable text (scanned images) and will be skipped - OCR is not enabled.")
         
         # Process button
         if st.button("🔍 Analyze Document", use_container_width=True):
@@ -506,12 +341,13 @@ def main():
             status_text = st.empty()
             
             try:
-                # Step 1: Extract text
+                # Step 1: Check extracted text (parsed once on upload)
                 status_text.text("📖 Extracting text from PDF...")
                 progress_bar.progress(10)
                 
-                file_bytes.seek(0)
-                text = extract_text_from_pdf(file_bytes)
+                if not text:
+                    st.error("❌ No text content found in the PDF (scanned/image-only pages are not supported).")
+                    return
                 
                 if len(text) < 100:
                     st.error("❌ PDF contains too little text to analyze.")
@@ -525,6 +361,7 @@ def main():
                 def claim_progress(msg):
                     status_text.text(f"🔎 {msg}")
                 
+                from app.claim_extractor import extract_claims
                 claims = extract_claims(text, progress_callback=claim_progress)
                 
                 if not claims:
@@ -546,13 +383,14 @@ def main():
                     pct = 40 + int(55 * current / total)
                     progress_bar.progress(min(pct, 95))
                 
-                results = verify_claims(claims, progress_callback=verify_progress)
+                results = run_verification(claims, progress_callback=verify_progress)
                 
                 progress_bar.progress(100)
                 status_text.text("✨ Analysis complete!")
                 
-                # Store results
+                # Store results, bucketed by status once for the filter tabs
                 st.session_state.results = results
+                st.session_state.buckets = bucket_by_status(results)
                 
             except Exception as e:
                 st.error(f"❌ Error processing document: {str(e)}")
@@ -567,6 +405,7 @@ def main():
             st.markdown("### 📊 Verification Results")
             
             # Stats
+            from app.verifier import get_summary_stats
             stats = get_summary_stats(results)
             render_stats(stats)
             
@@ -581,37 +420,19 @@ def main():
             ])
             
             with tab1:
-                for i, claim in enumerate(results):
-                    render_claim_card(claim, i)
-            
-            with tab2:
-                verified = [c for c in results if c.get("status", "").lower() == "verified"]
-                if verified:
-                    for i, claim in enumerate(verified):
-                        render_claim_card(claim, i)
-                else:
-                    st.info("No verified claims found.")
-            
-            with tab3:
-                inaccurate = [c for c in results if c.get("status", "").lower() == "inaccurate"]
-                if inaccurate:
-                    for i, claim in enumerate(inaccurate):
-                        render_claim_card(claim, i)
-                else:
-                    st.info("No inaccurate claims found.")
+                render_claim_list(results, "all")
             
-            with tab4:
-                false_claims = [c for c in results if c.get("status", "").lower() == "false"]
-                if false_claims:
-                    for i, claim in enumerate(false_claims):
-                        render_claim_card(claim, i)
-                else:
-                    st.info("No false claims found.")
+            buckets = st.session_state.buckets
+            for tab, status in ((tab2, "verified"), (tab3, "inaccurate"), (tab4, "false")):
+                with tab:
+                    if buckets[status]:
+                        render_claim_list(buckets[status], status)
+                    else:
+                        st.info(f"No {status} claims found.")
             
             # Export option
             st.markdown("---")
             if st.button("📥 Export Results as JSON"):
-                import json
                 json_str = json.dumps(results, indent=2)
                 st.download_button(
                     label="Download JSON",
@@ -1,47 +1,159 @@
 """
 PDF Parser Module
 Extracts text content from uploaded PDF files using pdfplumber.
+
+PyMuPDF is an opt-in faster backend: it is AGPL-3.0 licensed, so it is not a
+dependency of this MIT project and is only used when installed separately.
 """
 
+import multiprocessing
+import os
 import pdfplumber
-from io import BytesIO
-from typing import Optional
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, StringIO
+from typing import List, Optional, Tuple
+
+
+# pdfplumber's layout analysis is pure Python (GIL-bound), so large PDFs are
+# split across processes. Each worker re-opens the PDF, so only do it when
+# every worker gets a reasonable number of pages. Workers are spawned, not
+# forked: forking Streamlit's multithreaded server can copy held locks. A
+# spawned worker costs ~0.25s (interpreter + pdfplumber import) before it
+# re-opens the PDF, about 3 pages of layout analysis at ~0.08s/page, so each
+# worker needs enough pages to clearly pay that back.
+MAX_PDF_WORKERS = 8
+MIN_PAGES_PER_WORKER = 16
 
 
-def extract_text_from_pdf(pdf_file: BytesIO) -> str:
+def _extract_page_text(page) -> Optional[str]:
     """
-    Extract all text content from a PDF file.
+    Extract a pdfplumber page's text, skipping layout analysis entirely for
+    pages with no text characters (scanned/image-only pages).
+    """
+    if not page.chars:
+        return None
+    return page.extract_text()
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[Optional[str]]:
+    """Extract text for pages [start, stop) - runs in a worker process."""
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        return [_extract_page_text(page) for page in pdf.pages[start:stop]]
+
+
+def _extract_pages_parallel(pdf_bytes: bytes, page_count: int, workers: int) -> List[Optional[str]]:
+    """Extract all page texts using contiguous page ranges per worker process."""
+    step = -(-page_count // workers)  # ceil division
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [
+            executor.submit(_extract_page_range, pdf_bytes, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        return [text for future in futures for text in future.result()]
+
+
+def _pdfplumber_metadata(pdf) -> dict:
+    """Read page count, title and author from an open pdfplumber PDF."""
+    info = pdf.metadata or {}
+    return {
+        "pages": len(pdf.pages),
+        "title": info.get("Title"),
+        "author": info.get("Author")
+    }
+
+
+def _pymupdf_metadata(doc) -> dict:
+    """Read page count, title and author from an open PyMuPDF document."""
+    info = doc.metadata or {}
+    return {
+        "pages": doc.page_count,
+        "title": info.get("title") or None,
+        "author": info.get("author") or None
+    }
+
+
+def _extract_with_pdfplumber(pdf_bytes: bytes) -> Tuple[dict, List[Optional[str]]]:
+    """Extract metadata and page texts with pdfplumber, in parallel for large PDFs."""
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        metadata = _pdfplumber_metadata(pdf)
+        page_count = metadata["pages"]
+        workers = min(os.cpu_count() or 1, MAX_PDF_WORKERS, page_count // MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            return metadata, [_extract_page_text(page) for page in pdf.pages]
+    
+    return metadata, _extract_pages_parallel(pdf_bytes, page_count, workers)
+
+
+def _extract_with_pymupdf(pdf_bytes: bytes) -> Tuple[dict, List[Optional[str]]]:
+    """Extract metadata and page texts with PyMuPDF (C-backed, much faster than pdfplumber)."""
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return _pymupdf_metadata(doc), [page.get_text("text").strip() for page in doc]
+
+
+def parse_pdf(pdf_bytes: bytes) -> Tuple[dict, str]:
+    """
+    Open a PDF once and extract both its metadata and text content.
     
     Args:
-        pdf_file: A file-like object containing the PDF data
+        pdf_bytes: Raw PDF data
         
     Returns:
-        Extracted text as a single string
+        Tuple of (metadata dict, extracted text). The text is empty if no page
+        has extractable text; metadata["text_pages"] counts pages that do.
     """
-    text_content = []
-    
     try:
-        with pdfplumber.open(pdf_file) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                page_text = page.extract_text()
-                if page_text:
-                    text_content.append(f"--- Page {page_num} ---\n{page_text}")
-                    
+        if pymupdf is not None:
+            metadata, page_texts = _extract_with_pymupdf(pdf_bytes)
+        else:
+            metadata, page_texts = _extract_with_pdfplumber(pdf_bytes)
     except Exception as e:
         raise ValueError(f"Failed to parse PDF: {str(e)}")
     
-    if not text_content:
-        raise ValueError("No text content found in the PDF")
+    # Write pages straight into one buffer, "\n\n"-separated
+    text_content = StringIO()
+    text_pages = 0
+    for page_num, page_text in enumerate(page_texts, 1):
+        if page_text:
+            if text_pages:
+                text_content.write("\n\n")
+            text_content.write("--- Page ")
+            text_content.write(str(page_num))
+            text_content.write(" ---\n")
+            text_content.write(page_text)
+            text_pages += 1
+    
+    metadata["text_pages"] = text_pages
+    return metadata, text_content.getvalue()
+
+
+def extract_text_from_pdf(pdf_bytes: bytes) -> str:
+    """
+    Extract all text content from a PDF file.
+    
+    Args:
+        pdf_bytes: Raw PDF data
+        
+    Returns:
+        Extracted text as a single string
+    """
+    _, text = parse_pdf(pdf_bytes)
+    
+    if not text:
+        raise ValueError("No text content found in the PDF (scanned/image-only pages are not supported)")
         
-    return "\n\n".join(text_content)
+    return text
 
 
-def get_pdf_metadata(pdf_file: BytesIO) -> dict:
+def get_pdf_metadata(pdf_bytes: bytes) -> dict:
     """
     Extract metadata from a PDF file.
     
     Args:
-        pdf_file: A file-like object containing the PDF data
+        pdf_bytes: Raw PDF data
         
     Returns:
         Dictionary containing PDF metadata
@@ -53,12 +165,12 @@ def get_pdf_metadata(pdf_file: BytesIO) -> dict:
     }
     
     try:
-        pdf_file.seek(0)
-        with pdfplumber.open(pdf_file) as pdf:
-            metadata["pages"] = len(pdf.pages)
-            if pdf.metadata:
-                metadata["title"] = pdf.metadata.get("Title")
-                metadata["author"] = pdf.metadata.get("Author")
+        if pymupdf is not None:
+            with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+                metadata = _pymupdf_metadata(doc)
+        else:
+            with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+                metadata = _pdfplumber_metadata(pdf)
     except Exception:
         pass
         
@@ -1,8 +1,37 @@
 """
 LLM Prompts Module - Advanced Fact-Checking Prompts
 Designed for high-accuracy verification of claims, myths, and outdated data.
+
+Static instructions always come before the per-request fields (claim, search
+results, document text) so requests share a byte-identical prefix that the
+provider's prompt cache can reuse. Keep the static text deterministic: no
+timestamps, IDs or trailing whitespace.
 """
 
+from string import Formatter
+from typing import Callable
+
+
+def compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a str.format template once. The returned function fills in the
+    fields by joining the pre-split pieces instead of re-parsing the template.
+    """
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported format spec in prompt field: {field}")
+        parts.append((literal, field))
+    
+    def render(**fields) -> str:
+        return "".join([
+            literal + str(fields[field]) if field is not None else literal
+            for literal, field in parts
+        ])
+    
+    return render
+
+
 CLAIM_EXTRACTION_SYSTEM_PROMPT = """You are an expert fact-checker specialized in detecting VERIFIABLE FACTUAL CLAIMS that could be:
 - Intentionally false or misleading
 - Widely circulated myths
@@ -49,10 +78,7 @@ DO NOT EXTRACT: Opinions, predictions, marketing language, vague statements.
 
 For each claim, assess if it COULD be a lie, myth, or outdated. Be suspicious."""
 
-CLAIM_EXTRACTION_USER_PROMPT = """Analyze this text and extract ALL verifiable factual claims. Be thorough - assume the document may contain intentional misinformation.
-
-TEXT:
-{text}
+CLAIM_EXTRACTION_USER_PROMPT = """Analyze the text below and extract ALL verifiable factual claims. Be thorough - assume the document may contain intentional misinformation.
 
 Return JSON (extract EVERY specific claim with numbers, dates, or facts):
 {{
@@ -68,7 +94,10 @@ Return JSON (extract EVERY specific claim with numbers, dates, or facts):
     ]
 }}
 
-Be exhaustive. Extract every specific number, date, percentage, and factual statement."""
+Be exhaustive. Extract every specific number, date, percentage, and factual statement.
+
+TEXT:
+{text}"""
 
 VERIFICATION_SYSTEM_PROMPT = """You are a SKEPTICAL fact-checker. Your job is to CATCH LIES, MYTHS, and OUTDATED DATA.
 
@@ -111,17 +140,10 @@ COMMON FALSE CLAIMS TO CATCH:
 
 Output ONLY valid JSON."""
 
-VERIFICATION_USER_PROMPT = """VERIFY THIS CLAIM using the search results below:
-
-CLAIM: "{claim}"
-
-FOCUS: {verification_focus}
-
-SEARCH RESULTS:
-{search_results}
+VERIFICATION_USER_PROMPT = """VERIFY THE CLAIM at the end of this message using the search results given with it.
 
 INSTRUCTIONS:
-1. Find relevant information in the search results above
+1. Find relevant information in the search results below
 2. Compare the claim against what the sources say
 3. Write a DETAILED explanation citing the source name and what it says
 
@@ -147,16 +169,18 @@ Return this JSON:
     "sources": [{{"title": "Source Name", "url": "URL", "relevance": "What it says"}}]
 }}
 
-JSON:"""
-
-# Special prompts for different claim types
-FINANCIAL_VERIFICATION_PROMPT = """VERIFY THIS FINANCIAL CLAIM (prices change daily):
-
 CLAIM: "{claim}"
 
+FOCUS: {verification_focus}
+
 SEARCH RESULTS:
 {search_results}
 
+JSON:"""
+
+# Special prompts for different claim types
+FINANCIAL_VERIFICATION_PROMPT = """VERIFY THE FINANCIAL CLAIM at the end of this message (prices change daily).
+
 CHECKS:
 1. Is this the CURRENT price or outdated?
 2. What do the sources say the actual value is?
@@ -177,15 +201,18 @@ Return JSON:
     "sources": [{{"title": "Source", "url": "URL", "relevance": "What it says"}}]
 }}
 
-JSON:"""
+CLAIM: "{claim}"
 
-MYTH_DETECTION_PROMPT = """CHECK IF THIS IS A COMMON MYTH:
+SEARCH RESULTS:
+{search_results}
 
-CLAIM: "{claim}"
+JSON:"""
+
+MYTH_DETECTION_PROMPT = """CHECK IF THE CLAIM at the end of this message IS A COMMON MYTH.
 
 Known myths include:
 - "Humans use only 10% of brain" (FALSE)
-- "Goldfish have 3-second memory" (FALSE) 
+- "Goldfish have 3-second memory" (FALSE)
 - "Lightning never strikes twice" (FALSE)
 - "Great Wall visible from space" (FALSE)
 - "Sugar makes children hyperactive" (FALSE)
@@ -193,7 +220,15 @@ Known myths include:
 - "Bats are blind" (FALSE)
 - "Bulls hate red color" (FALSE)
 
+CLAIM: "{claim}"
+
 SEARCH RESULTS:
 {search_results}
 
 Is this a debunked myth? Respond with JSON:"""
+
+
+# Pre-parsed renderers for the prompts filled in on every request
+build_claim_extraction_prompt = compile_prompt(CLAIM_EXTRACTION_USER_PROMPT)
+build_verification_prompt = compile_prompt(VERIFICATION_USER_PROMPT)
+build_financial_verification_prompt = compile_prompt(FINANCIAL_VERIFICATION_PROMPT)
@@ -0,0 +1,290 @@
+"""
+Styles Module
+Custom CSS for the Streamlit UI, kept out of main.py so the script Streamlit
+re-executes on every rerun doesn't rebuild the stylesheet each time.
+"""
+
+APP_CSS = """
+<style>
+    /* Main theme colors */
+    :root {
+        --verified-color: #10b981;
+        --inaccurate-color: #f59e0b;
+        --false-color: #ef4444;
+        --bg-dark: #0f172a;
+        --bg-card: #1e293b;
+        --text-primary: #f8fafc;
+        --text-secondary: #94a3b8;
+    }
+    
+    /* Hide default Streamlit elements */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    
+    /* Main container styling */
+    .main .block-container {
+        padding-top: 2rem;
+        max-width: 1200px;
+    }
+    
+    /* Header styling */
+    .main-header {
+        text-align: center;
+        padding: 2rem 0;
+        background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
+        border-radius: 16px;
+        margin-bottom: 2rem;
+        border: 1px solid #334155;
+    }
+    
+    .main-header h1 {
+        color: #f8fafc;
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+    }
+    
+    .main-header p {
+        color: #94a3b8;
+        font-size: 1.1rem;
+    }
+    
+    /* Upload area styling */
+    .upload-area {
+        border: 2px dashed #475569;
+        border-radius: 12px;
+        padding: 3rem 2rem;
+        text-align: center;
+        background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);
+        transition: all 0.3s ease;
+    }
+    
+    .upload-area:hover {
+        border-color: #6366f1;
+        background: linear-gradient(180deg, #1e293b 0%, #1e1b4b 100%);
+    }
+    
+    /* Stats cards */
+    .stats-container {
+        display: flex;
+        gap: 1rem;
+        margin: 1.5rem 0;
+    }
+    
+    .stat-card {
+        flex: 1;
+        padding: 1.5rem;
+        border-radius: 12px;
+        text-align: center;
+        border: 1px solid #334155;
+    }
+    
+    .stat-card.verified {
+        background: linear-gradient(135deg, #064e3b 0%, #0f172a 100%);
+        border-color: #10b981;
+    }
+    
+    .stat-card.inaccurate {
+        background: linear-gradient(135deg, #78350f 0%, #0f172a 100%);
+        border-color: #f59e0b;
+    }
+    
+    .stat-card.false {
+        background: linear-gradient(135deg, #7f1d1d 0%, #0f172a 100%);
+        border-color: #ef4444;
+    }
+    
+    .stat-number {
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin-bottom: 0.25rem;
+    }
+    
+    .stat-label {
+        color: #94a3b8;
+        font-size: 0.9rem;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+    }
+    
+    /* Claim cards */
+    .claim-card {
+        background: #1e293b;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin-bottom: 1rem;
+        border-left: 4px solid;
+        transition: transform 0.2s ease, box-shadow 0.2s ease;
+    }
+    
+    .claim-card:hover {
+        transform: translateX(4px);
+        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
+    }
+    
+    .claim-card.verified {
+        border-left-color: #10b981;
+    }
+    
+    .claim-card.inaccurate {
+        border-left-color: #f59e0b;
+    }
+    
+    .claim-card.false {
+        border-left-color: #ef4444;
+    }
+    
+    .claim-card summary {
+        cursor: pointer;
+        color: #f8fafc;
+        font-weight: 600;
+        line-height: 1.6;
+    }
+    
+    .claim-card[open] summary {
+        margin-bottom: 1rem;
+    }
+    
+    .claim-text {
+        font-size: 1.1rem;
+        color: #f8fafc;
+        margin-bottom: 1rem;
+        line-height: 1.6;
+    }
+    
+    .claim-meta {
+        display: flex;
+        gap: 0.5rem;
+        flex-wrap: wrap;
+        margin-bottom: 1rem;
+    }
+    
+    .claim-tag {
+        padding: 0.25rem 0.75rem;
+        border-radius: 9999px;
+        font-size: 0.75rem;
+        font-weight: 500;
+        text-transform: uppercase;
+    }
+    
+    .tag-verified {
+        background: rgba(16, 185, 129, 0.2);
+        color: #10b981;
+    }
+    
+    .tag-inaccurate {
+        background: rgba(245, 158, 11, 0.2);
+        color: #f59e0b;
+    }
+    
+    .tag-false {
+        background: rgba(239, 68, 68, 0.2);
+        color: #ef4444;
+    }
+    
+    .tag-type {
+        background: rgba(99, 102, 241, 0.2);
+        color: #818cf8;
+    }
+    
+    .explanation-box {
+        background: #0f172a;
+        border-radius: 8px;
+        padding: 1rem;
+        margin: 1rem 0;
+        border: 1px solid #334155;
+    }
+    
+    .explanation-title {
+        color: #94a3b8;
+        font-size: 0.8rem;
+        text-transform: uppercase;
+        margin-bottom: 0.5rem;
+        letter-spacing: 0.05em;
+    }
+    
+    .explanation-text {
+        color: #e2e8f0;
+        line-height: 1.6;
+    }
+    
+    .correct-value {
+        background: rgba(245, 158, 11, 0.1);
+        border: 1px solid #f59e0b;
+        border-radius: 8px;
+        padding: 1rem;
+        margin: 1rem 0;
+    }
+    
+    .correct-value-label {
+        color: #f59e0b;
+        font-size: 0.8rem;
+        text-transform: uppercase;
+        margin-bottom: 0.25rem;
+    }
+    
+    .correct-value-text {
+        color: #fef3c7;
+        font-weight: 600;
+    }
+    
+    .sources-list {
+        margin-top: 1rem;
+    }
+    
+    .source-item {
+        display: flex;
+        align-items: flex-start;
+        gap: 0.5rem;
+        padding: 0.5rem 0;
+        border-bottom: 1px solid #334155;
+    }
+    
+    .source-item:last-child {
+        border-bottom: none;
+    }
+    
+    .source-link {
+        color: #60a5fa;
+        text-decoration: none;
+        font-size: 0.9rem;
+    }
+    
+    .source-link:hover {
+        color: #93c5fd;
+        text-decoration: underline;
+    }
+    
+    /* Processing indicator */
+    .processing-container {
+        text-align: center;
+        padding: 3rem;
+    }
+    
+    .stProgress > div > div {
+        background-color: #6366f1;
+    }
+    
+    /* Sidebar styling */
+    .sidebar .sidebar-content {
+        background: #0f172a;
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        background: linear-gradient(135deg, #6366f1 0%, #4f46e5 100%);
+        color: white;
+        border: none;
+        padding: 0.75rem 2rem;
+        border-radius: 8px;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        background: linear-gradient(135deg, #818cf8 0%, #6366f1 100%);
+        transform: translateY(-2px);
+        box-shadow: 0 4px 12px rgba(99, 102, 241, 0.4);
+    }
+</style>
+"""
@@ -7,23 +7,51 @@ import json
 import re
 import os
 import time
-from typing import Dict, Any, List, Optional
+import hashlib
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal
+from functools import lru_cache
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 try:
     from ddgs import DDGS
 except ImportError:
     from duckduckgo_search import DDGS
+from groq import APIConnectionError, BadRequestError, InternalServerError, RateLimitError
 from langchain_groq import ChatGroq
 from langchain_core.messages import SystemMessage, HumanMessage
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from .prompts import (
-    VERIFICATION_SYSTEM_PROMPT, 
-    VERIFICATION_USER_PROMPT,
-    FINANCIAL_VERIFICATION_PROMPT,
-    MYTH_DETECTION_PROMPT
+    VERIFICATION_SYSTEM_PROMPT,
+    build_verification_prompt,
+    build_financial_verification_prompt
 )
 
 
+# Static system prefix shared by every verification request (see prompts.py)
+VERIFICATION_SYSTEM_MESSAGE = SystemMessage(content=VERIFICATION_SYSTEM_PROMPT)
+
+# Concurrent claim verifications; kept modest since DDGS and the Groq free
+# tier both rate-limit bursts
+MAX_VERIFY_WORKERS = 4
+
+# Groq errors worth retrying (timeouts/connection drops, 429s, 5xx); anything
+# else, e.g. a bad API key, fails fast.
+TRANSIENT_LLM_ERRORS = (APIConnectionError, InternalServerError, RateLimitError)
+
+# Consecutive LLM calls that may exhaust their retries on transient errors
+# before the rest are short-circuited, and how long the breaker stays open
+LLM_BREAKER_FAIL_MAX = 3
+LLM_BREAKER_RESET_TIMEOUT = 30
+
 # Common myths database for quick detection
 KNOWN_MYTHS = {
     "10% of brain": {"status": "false", "correct": "Humans use virtually all parts of their brain", "explanation": "This is a debunked myth. Brain scans show activity throughout the entire brain."},
@@ -36,6 +64,78 @@ KNOWN_MYTHS = {
     "bulls.*red": {"status": "false", "correct": "Bulls are colorblind to red; they react to movement", "explanation": "Bulls charge at the cape's movement, not its color."},
 }
 
+# In-memory TTL/LRU cache of LLM verdicts, keyed by a hash of the canonical claim and
+# the formatted search results. Financial data goes stale quickly, so it expires sooner.
+VERDICT_CACHE_SIZE = 1024
+VERDICT_CACHE_TTL = 3600
+FINANCIAL_VERDICT_CACHE_TTL = 900
+
+# Raw DDGS hits, keyed by normalized query; repeated claims and the backup
+# searches often issue the same query within a run
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 3600
+FINANCIAL_SEARCH_CACHE_TTL = 300
+
+# Claim canonicalization for verdict cache keys, so trivially different
+# phrasings ("$69K" / "$69,000", case, punctuation) share an entry
+THOUSANDS_SEP_RE = re.compile(r'(?<=\d),(?=\d{3}\b)')
+MAGNITUDE_RE = re.compile(
+    r'(\$?)(\d+(?:\.\d+)?)(?:\s*(thousand|million|billion|trillion)\b|(k|m|bn|b)\b)',
+    re.IGNORECASE
+)
+MAGNITUDES = {
+    "thousand": 10**3, "k": 10**3,
+    "million": 10**6, "m": 10**6,
+    "billion": 10**9, "bn": 10**9, "b": 10**9,
+    "trillion": 10**12,
+}
+# Punctuation becomes a space, except % and $, decimal points inside numbers
+# and signs/separators touching a digit ("-5%", "10-20", "3:1", "1/2"), so
+# claims with different numbers never share a key
+CANONICAL_PUNCT_RE = re.compile(r'(?!(?<=\d)\.(?=\d))(?![-/:](?=\d))(?!(?<=\d)[-/:])[^\w\s%$]|_')
+
+# Search snippet cleanup before they are spliced into the verification prompt
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+MAX_SNIPPET_CHARS = 400
+MAX_SEARCH_RESULTS_CHARS = 6000
+
+# All myth patterns in one case-insensitive alternation; the named group that
+# matches indexes back into KNOWN_MYTHS_LIST
+KNOWN_MYTHS_LIST = list(KNOWN_MYTHS.items())
+KNOWN_MYTHS_RE = re.compile(
+    "|".join(f"(?P<m{i}>{pattern})" for i, (pattern, _) in enumerate(KNOWN_MYTHS_LIST)),
+    re.IGNORECASE
+)
+
+# Numbers for extract_numbers, most specific form first, so one pass yields
+# each number once ("$1.5 billion", not also "1.5 billion" and "1.5"); every
+# form starts with a digit so stray commas aren't reported
+NUMBER_RE = re.compile(
+    r'\$\d[\d,]*(?:\.\d+)?(?:\s*(?:billion|million|trillion))?'  # Money
+    r'|\d[\d,]*(?:\.\d+)?%'  # Percentages
+    r'|\d[\d,]*(?:\.\d+)?(?:\s*(?:billion|million|trillion))'  # Large numbers
+    r'|\b\d{4}\b'  # Years
+    r'|\d[\d,]*(?:\.\d+)?',  # Regular numbers
+    re.IGNORECASE
+)
+
+# LLM response JSON extraction
+JSON_FENCE_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+CODE_FENCE_RE = re.compile(r'```\s*([\s\S]*?)\s*```')
+JSON_STATUS_OBJECT_RE = re.compile(r'\{[^{}]*"status"[^{}]*\}')
+JSON_DECODER = json.JSONDecoder()
+
+# Status keywords for parse_text_response, one alternation per status
+FALSE_PHRASES_RE = re.compile("|".join(map(re.escape, ['is false', 'is incorrect', 'is wrong', 'debunked', 'myth', 'no evidence', 'fabricated'])), re.IGNORECASE)
+INACCURATE_PHRASES_RE = re.compile("|".join(map(re.escape, ['outdated', 'was correct', 'old data', 'previously', 'no longer', 'changed to', 'now is'])), re.IGNORECASE)
+VERIFIED_PHRASES_RE = re.compile("|".join(map(re.escape, ['verified', 'confirmed', 'accurate', 'correct', 'true', 'matches'])), re.IGNORECASE)
+MYTH_RE = re.compile('myth', re.IGNORECASE)
+OUTDATED_RE = re.compile('outdated|old', re.IGNORECASE)
+
+# Key terms for search_with_keywords
+KEY_TERM_RE = re.compile(r'(?P<number>\d+(?:\.\d+)?%?)|(?P<proper_noun>\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b)')
+
 # TRUSTED SOURCES - Prioritize these domains
 TRUSTED_DOMAINS = [
     # Official & Government
@@ -74,22 +174,214 @@ BLOCKED_DOMAINS = [
 ]
 
 
+
+def compile_domain_rules(domains: List[str]) -> Tuple[frozenset, frozenset, tuple]:
+    """
+    Split a domain list into host-suffix, host-label and host+path rules:
+    "reuters.com" / ".cn" match the host or a parent domain, "gov" / ".gov." /
+    "blogspot" match any label of the host, "yahoo.com/finance" also needs
+    the path prefix.
+    """
+    suffixes, labels, paths = set(), set(), []
+    for domain in domains:
+        if "/" in domain:
+            host, path = domain.split("/", 1)
+            paths.append((host, "/" + path))
+        elif domain.endswith(".") or "." not in domain:
+            labels.add(domain.strip("."))
+        else:
+            suffixes.add(domain.lstrip("."))
+    return frozenset(suffixes), frozenset(labels), tuple(paths)
+
+
+# Domain lists matched against the parsed host, so e.g. "gov" no longer
+# matches "government-hoax.com" and ".cn" no longer matches "cnn.com"
+TRUSTED_DOMAIN_RULES = compile_domain_rules(TRUSTED_DOMAINS)
+BLOCKED_DOMAIN_RULES = compile_domain_rules(BLOCKED_DOMAINS)
+# Extra boost in score_source on top of the trusted-domain bonus
+HIGH_AUTHORITY_DOMAIN_RULES = compile_domain_rules([
+    "gov", "reuters.com", "apnews.com", "bbc.com", "bbc.co.uk",
+    "wikipedia.org", "snopes.com", "factcheck.org",
+])
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a per-entry TTL."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure breaker: after fail_max calls in a row
+    raise one of failure_types it opens for reset_timeout seconds, then lets a
+    single trial call through. The trial closes it again unless it fails too.
+    """
+    
+    def __init__(self, name: str, fail_max: int, reset_timeout: float, failure_types: Tuple[type, ...]):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failure_types = failure_types
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+    
+    def allow_request(self) -> bool:
+        """Return False while open; once the timeout passes, admit one trial caller."""
+        with self._lock:
+            if self._failures < self.fail_max:
+                return True
+            if self._trial_running or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_running = True
+            return True
+    
+    def record_success(self) -> None:
+        """Close the breaker and reset the consecutive-failure count."""
+        with self._lock:
+            self._failures = 0
+            self._trial_running = False
+    
+    def record_failure(self) -> None:
+        """Count a failure, (re)opening the breaker once fail_max is reached."""
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+    
+    def call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run func through the breaker. Only failure_types count as failures;
+        any other outcome, including other errors, means the service answered.
+        """
+        if not self.allow_request():
+            raise RuntimeError(f"{self.name} is unavailable after repeated failures; try again shortly")
+        try:
+            result = func(*args)
+        except self.failure_types:
+            self.record_failure()
+            raise
+        except BaseException:
+            self.record_success()
+            raise
+        self.record_success()
+        return result
+
+
+_verdict_cache = TTLCache(VERDICT_CACHE_SIZE)
+_search_cache = TTLCache(SEARCH_CACHE_SIZE)
+_ddgs_local = threading.local()
+_llm_breaker = CircuitBreaker("LLM service", LLM_BREAKER_FAIL_MAX, LLM_BREAKER_RESET_TIMEOUT, TRANSIENT_LLM_ERRORS)
+
+
+def get_ddgs() -> DDGS:
+    """
+    Return this thread's DDGS client, so its HTTP session (connection pool,
+    TLS) is reused across searches. One per thread since DDGS keeps
+    per-session state and isn't documented as thread-safe.
+    """
+    ddgs = getattr(_ddgs_local, "client", None)
+    if ddgs is None:
+        ddgs = _ddgs_local.client = DDGS()
+    return ddgs
+
+
+def ddgs_text(query: str, max_results: int, ttl: float = SEARCH_CACHE_TTL) -> List[Dict[str, Any]]:
+    """Run a DDGS text search, reusing recent results for the same normalized query."""
+    key = f"{max_results}\0{WHITESPACE_RE.sub(' ', query.lower()).strip()}"
+    results = _search_cache.get(key)
+    if results is None:
+        results = list(get_ddgs().text(query, max_results=max_results, region='wt-wt'))
+        _search_cache.set(key, results, ttl)
+    return results
+
+
+@lru_cache(maxsize=4096)
+def normalize_url(url: str) -> str:
+    """
+    Dedup key for a URL: ignores scheme, "www.", host case, trailing slash,
+    fragment and utm_* tracking parameters.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:  # e.g. malformed IPv6 host
+        return url
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = "&".join(
+        param for param in parts.query.split("&")
+        if param and not param.lower().startswith("utm_")
+    )
+    return f"{host}{parts.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+
+def url_matches_domains(url: str, rules: Tuple[frozenset, frozenset, tuple]) -> bool:
+    """Check a URL's host (and path, for path rules) against compiled domain rules."""
+    suffixes, labels, paths = rules
+    try:
+        parts = urlsplit(url.strip() if "://" in url else "//" + url.strip())
+        host = (parts.hostname or "").rstrip(".")
+    except ValueError:
+        return False
+    if not host:
+        return False
+    
+    host_labels = host.split(".")
+    if not labels.isdisjoint(host_labels):
+        return True
+    
+    parents = {".".join(host_labels[i:]) for i in range(len(host_labels))}
+    if not suffixes.isdisjoint(parents):
+        return True
+    
+    path = parts.path.lower()
+    return any(domain in parents and path.startswith(prefix) for domain, prefix in paths)
+
+
+@lru_cache(maxsize=4096)
 def is_trusted_source(url: str) -> bool:
     """Check if URL is from a trusted source."""
-    url_lower = url.lower()
-    for domain in TRUSTED_DOMAINS:
-        if domain in url_lower:
-            return True
-    return False
+    return url_matches_domains(url, TRUSTED_DOMAIN_RULES)
 
 
+@lru_cache(maxsize=4096)
 def is_blocked_source(url: str) -> bool:
     """Check if URL is from a blocked/unreliable source."""
-    url_lower = url.lower()
-    for domain in BLOCKED_DOMAINS:
-        if domain in url_lower:
-            return True
-    return False
+    return url_matches_domains(url, BLOCKED_DOMAIN_RULES)
+
+
+@lru_cache(maxsize=4096)
+def is_high_authority_source(url: str) -> bool:
+    """Check if URL is from one of the high-authority domains."""
+    return url_matches_domains(url, HIGH_AUTHORITY_DOMAIN_RULES)
 
 
 def score_source(result: Dict[str, Any]) -> int:
@@ -106,7 +398,7 @@ def score_source(result: Dict[str, Any]) -> int:
         score -= 200
     
     # Boost for specific high-authority domains
-    if any(d in url for d in [".gov", "reuters", "apnews", "bbc", "wikipedia", "snopes", "factcheck"]):
+    if is_high_authority_source(url):
         score += 50
     
     # Boost for having snippet content
@@ -127,53 +419,52 @@ def filter_and_rank_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any
     return filtered
 
 
+@lru_cache(maxsize=1)
+def _create_llm(api_key: str) -> ChatGroq:
+    """Build the Groq client once per API key so its HTTP pool is shared across claims."""
+    # JSON mode: Groq constrains decoding to a valid JSON object, so the
+    # verdict no longer needs rescuing from prose or code fences
+    return ChatGroq(
+        model="llama-3.1-8b-instant",
+        api_key=api_key,
+        temperature=0,
+        max_tokens=1024,
+        model_kwargs={"response_format": {"type": "json_object"}}
+    )
+
+
 def get_llm():
     """Initialize the Groq LLM client - fast model."""
     api_key = os.environ.get("GROQ_API_KEY")
     if not api_key:
         raise ValueError("GROQ_API_KEY environment variable is not set")
     
-    return ChatGroq(
-        model="llama-3.1-8b-instant",
-        api_key=api_key,
-        temperature=0,
-        max_tokens=1024
-    )
+    return _create_llm(api_key)
 
 
 def check_known_myths(claim: str) -> Optional[Dict[str, Any]]:
     """Check if claim matches known myths."""
-    claim_lower = claim.lower()
-    for pattern, result in KNOWN_MYTHS.items():
-        if re.search(pattern, claim_lower):
-            return {
-                "status": result["status"],
-                "explanation": result["explanation"],
-                "correct_value": result["correct"],
-                "confidence": "high",
-                "is_myth": True,
-                "is_outdated": False,
-                "sources": [{"title": "Scientific Consensus", "url": "https://www.snopes.com", "relevance": "Myth debunked"}]
-            }
+    match = KNOWN_MYTHS_RE.search(claim)
+    if match:
+        result = KNOWN_MYTHS_LIST[int(match.lastgroup[1:])][1]
+        return {
+            "status": result["status"],
+            "explanation": result["explanation"],
+            "correct_value": result["correct"],
+            "confidence": "high",
+            "is_myth": True,
+            "is_outdated": False,
+            "sources": [{"title": "Scientific Consensus", "url": "https://www.snopes.com", "relevance": "Myth debunked"}]
+        }
     return None
 
 
 def extract_numbers(text: str) -> List[str]:
     """Extract all numbers, percentages, and monetary values from text."""
-    patterns = [
-        r'\$[\d,]+(?:\.\d+)?(?:\s*(?:billion|million|trillion))?',  # Money
-        r'[\d,]+(?:\.\d+)?%',  # Percentages
-        r'[\d,]+(?:\.\d+)?(?:\s*(?:billion|million|trillion))',  # Large numbers
-        r'\b\d{4}\b',  # Years
-        r'[\d,]+(?:\.\d+)?',  # Regular numbers
-    ]
-    numbers = []
-    for pattern in patterns:
-        numbers.extend(re.findall(pattern, text, re.IGNORECASE))
-    return numbers
+    return NUMBER_RE.findall(text)
 
 
-def search_web(query: str, max_results: int = 8) -> List[Dict[str, Any]]:
+def search_web(query: str, max_results: int = 8, cache_ttl: float = SEARCH_CACHE_TTL) -> List[Dict[str, Any]]:
     """
     Fast, accurate web search with trusted source filtering.
     Single optimized search - no retries for speed.
@@ -181,14 +472,20 @@ def search_web(query: str, max_results: int = 8) -> List[Dict[str, Any]]:
     query = query.strip()[:150]
     
     try:
-        ddgs = DDGS()
-        results = list(ddgs.text(query, max_results=max_results + 3, region='wt-wt'))
+        results = ddgs_text(query, max_results + 3, ttl=cache_ttl)
         
         formatted = []
+        seen_urls = set()
         for r in results:
+            url = r.get("href", r.get("link", ""))
+            # DDGS can return the same page twice; drop repeats by URL
+            url_key = normalize_url(url)
+            if url_key in seen_urls:
+                continue
+            seen_urls.add(url_key)
             formatted.append({
                 "title": r.get("title", ""),
-                "url": r.get("href", r.get("link", "")),
+                "url": url,
                 "snippet": r.get("body", r.get("snippet", ""))
             })
         
@@ -202,10 +499,9 @@ def search_web(query: str, max_results: int = 8) -> List[Dict[str, Any]]:
 def search_with_fact_check_sites(claim: str) -> List[Dict[str, Any]]:
     """Fast search on fact-checking websites - single query."""
     try:
-        ddgs = DDGS()
         # Combined query for speed
         query = f"{claim[:80]} fact check"
-        results = list(ddgs.text(query, max_results=4, region='wt-wt'))
+        results = ddgs_text(query, 4)
         return [{"title": r.get("title", ""), "url": r.get("href", ""), "snippet": r.get("body", "")} for r in results]
     except:
         return []
@@ -216,9 +512,8 @@ def search_financial_data(claim: str, entities: List[str]) -> List[Dict[str, Any
     if not entities:
         return []
     try:
-        ddgs = DDGS()
         query = f"{entities[0]} stock price market cap 2024 2025"
-        results = list(ddgs.text(query, max_results=4, region='wt-wt'))
+        results = ddgs_text(query, 4, ttl=FINANCIAL_SEARCH_CACHE_TTL)
         return filter_and_rank_results([{"title": r.get("title", ""), "url": r.get("href", ""), "snippet": r.get("body", "")} for r in results])
     except:
         return []
@@ -226,11 +521,15 @@ def search_financial_data(claim: str, entities: List[str]) -> List[Dict[str, Any
 
 def search_with_keywords(claim: str) -> List[Dict[str, Any]]:
     """Extract key terms from claim and search."""
-    # Extract numbers, years, percentages
-    numbers = re.findall(r'\d+(?:\.\d+)?%?', claim)
-    
-    # Extract capitalized words (proper nouns)
-    proper_nouns = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', claim)
+    # Extract numbers/years/percentages and capitalized words (proper nouns)
+    # in one pass - the two alternatives never overlap
+    numbers = []
+    proper_nouns = []
+    for match in KEY_TERM_RE.finditer(claim):
+        if match.lastgroup == "number":
+            numbers.append(match.group())
+        else:
+            proper_nouns.append(match.group())
     
     # Build focused search query
     key_terms = proper_nouns[:3] + numbers[:2]
@@ -244,85 +543,116 @@ def search_with_keywords(claim: str) -> List[Dict[str, Any]]:
 def search_statistics(claim: str) -> List[Dict[str, Any]]:
     """Fast statistics search - single query."""
     try:
-        ddgs = DDGS()
         query = f"{claim[:80]} statistics data"
-        results = list(ddgs.text(query, max_results=3, region='wt-wt'))
+        results = ddgs_text(query, 3)
         return filter_and_rank_results([{"title": r.get("title", ""), "url": r.get("href", ""), "snippet": r.get("body", "")} for r in results])
     except:
         return []
 
 
+def clean_snippet(snippet: str) -> str:
+    """Strip HTML and collapse whitespace, truncating long snippets on a sentence boundary."""
+    snippet = WHITESPACE_RE.sub(' ', HTML_TAG_RE.sub(' ', snippet)).strip()
+    if len(snippet) <= MAX_SNIPPET_CHARS:
+        return snippet
+    
+    cut = snippet[:MAX_SNIPPET_CHARS]
+    end = cut.rfind('. ')
+    if end < MAX_SNIPPET_CHARS // 2:
+        return cut.rsplit(' ', 1)[0] + "..."
+    return cut[:end + 1]
+
+
 def format_search_results(results: List[Dict[str, Any]]) -> str:
     """Format search results for LLM analysis with source trust indicators."""
     if not results:
         return "[WARNING] NO SEARCH RESULTS FOUND. Mark as FALSE unless you are 100% certain of the fact."
     
     formatted = []
-    for i, r in enumerate(results, 1):
+    seen_snippets = set()
+    total_chars = 0
+    for r in results:
         title = r.get('title', 'N/A')
         url = r.get('url', 'N/A')
-        snippet = r.get('snippet', 'N/A')
+        snippet = clean_snippet(r.get('snippet') or '') or 'N/A'
+        
+        # Engines often return the same snippet under several URLs
+        snippet_key = snippet.lower()
+        if snippet != 'N/A' and snippet_key in seen_snippets:
+            continue
+        seen_snippets.add(snippet_key)
         
         # Add trust indicator
         trust = "[TRUSTED]" if is_trusted_source(url) else "[Standard]"
         
-        formatted.append(f"""
-=== SOURCE {i} {trust} ===
+        block = f"""
+=== SOURCE {len(formatted) + 1} {trust} ===
 Title: {title}
 URL: {url}
 Content: {snippet}
-""")
+"""
+        # Cap the total so a few long results don't blow up the prompt
+        if formatted and total_chars + len(block) > MAX_SEARCH_RESULTS_CHARS:
+            break
+        total_chars += len(block)
+        formatted.append(block)
     
     return "\n".join(formatted) + "\n=== END OF SOURCES ==="
 
 
 def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
     """Extract JSON object from LLM response using multiple strategies."""
+    # Fast path: JSON mode responses are a bare object; otherwise the span
+    # from the first '{' to the last '}' usually is one (fenced or wrapped
+    # in prose), so try it before the regex strategies
+    start, end = text.find('{'), text.rfind('}')
+    if start != -1 and end > start:
+        try:
+            result = json_loads(text[start:end + 1])
+            if isinstance(result, dict):
+                return result
+        except json.JSONDecodeError:
+            pass
+    
     # Strategy 1: ```json block
-    json_match = re.search(r'```json\s*([\s\S]*?)\s*```', text)
+    json_match = JSON_FENCE_RE.search(text)
     if json_match:
         try:
-            return json.loads(json_match.group(1).strip())
+            return json_loads(json_match.group(1).strip())
         except json.JSONDecodeError:
             pass
     
     # Strategy 2: ``` block
-    code_match = re.search(r'```\s*([\s\S]*?)\s*```', text)
+    code_match = CODE_FENCE_RE.search(text)
     if code_match:
         try:
-            return json.loads(code_match.group(1).strip())
+            return json_loads(code_match.group(1).strip())
         except json.JSONDecodeError:
             pass
     
     # Strategy 3: Find JSON object with status field
-    json_obj_match = re.search(r'\{[^{}]*"status"[^{}]*\}', text, re.DOTALL)
+    json_obj_match = JSON_STATUS_OBJECT_RE.search(text)
     if json_obj_match:
         try:
-            return json.loads(json_obj_match.group(0))
+            return json_loads(json_obj_match.group(0))
         except json.JSONDecodeError:
             pass
     
-    # Strategy 4: Find any JSON object
-    try:
-        start = text.find('{')
-        if start != -1:
-            brace_count = 0
-            for i, char in enumerate(text[start:], start):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        try:
-                            return json.loads(text[start:i+1])
-                        except json.JSONDecodeError:
-                            break
-    except:
-        pass
+    # Strategy 4: Find any JSON object - raw_decode parses from each '{' in C
+    # and, unlike brace counting, copes with braces inside strings
+    start = text.find('{')
+    while start != -1:
+        try:
+            obj, _ = JSON_DECODER.raw_decode(text, start)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        start = text.find('{', start + 1)
     
     # Strategy 5: Whole text as JSON
     try:
-        return json.loads(text.strip())
+        return json_loads(text.strip())
     except json.JSONDecodeError:
         pass
     
@@ -331,14 +661,12 @@ def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
 
 def parse_text_response(text: str, search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Parse non-JSON response to extract verification info."""
-    text_lower = text.lower()
-    
-    # Determine status from keywords with priority
-    if any(phrase in text_lower for phrase in ['is false', 'is incorrect', 'is wrong', 'debunked', 'myth', 'no evidence', 'fabricated']):
+    # Case-insensitive patterns, so the text isn't copied by lower()
+    if FALSE_PHRASES_RE.search(text):
         status = 'false'
-    elif any(phrase in text_lower for phrase in ['outdated', 'was correct', 'old data', 'previously', 'no longer', 'changed to', 'now is']):
+    elif INACCURATE_PHRASES_RE.search(text):
         status = 'inaccurate'
-    elif any(phrase in text_lower for phrase in ['verified', 'confirmed', 'accurate', 'correct', 'true', 'matches']):
+    elif VERIFIED_PHRASES_RE.search(text):
         status = 'verified'
     else:
         status = 'false'  # Default to false for safety
@@ -357,13 +685,55 @@ def parse_text_response(text: str, search_results: List[Dict[str, Any]]) -> Dict
         "explanation": text[:800] if len(text) > 800 else text,
         "correct_value": None,
         "confidence": "medium",
-        "is_myth": 'myth' in text_lower,
-        "is_outdated": 'outdated' in text_lower or 'old' in text_lower,
+        "is_myth": MYTH_RE.search(text) is not None,
+        "is_outdated": OUTDATED_RE.search(text) is not None,
         "sources": sources
     }
 
 
-@retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=0.5, min=1, max=3))
+def _expand_magnitude(match: re.Match) -> str:
+    dollar, number, word, suffix = match.groups()
+    # Bare letter suffixes are only unambiguous on money ("5m" may be metres)
+    if suffix and not dollar:
+        return match.group(0)
+    value = Decimal(number) * MAGNITUDES[(word or suffix).lower()]
+    return dollar + format(value.normalize(), 'f')
+
+
+def canonicalize_claim(claim: str) -> str:
+    """Canonical form of a claim for cache keys: case/width-folded, punctuation-free, numbers expanded."""
+    text = unicodedata.normalize("NFKC", claim).casefold()
+    text = THOUSANDS_SEP_RE.sub('', text)
+    text = MAGNITUDE_RE.sub(_expand_magnitude, text)
+    text = CANONICAL_PUNCT_RE.sub(' ', text)
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+def failed_json_generation(error: BadRequestError) -> Optional[str]:
+    """Return the model output Groq's JSON mode rejected, if that's what the 400 was."""
+    body = error.body
+    if isinstance(body, dict):
+        body = body.get("error", body)
+    if isinstance(body, dict) and body.get("code") == "json_validate_failed":
+        return str(body.get("failed_generation") or "").strip()
+    return None
+
+
+# Only transient errors are retried (with jitter, so concurrent workers
+# don't retry in lockstep); anything else fails fast. reraise surfaces the
+# real error in the "Could not verify" result rather than a RetryError.
+# Only the API call is retried - the prompt is built once by the caller.
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.5, min=0.2, max=5),
+    retry=retry_if_exception_type(TRANSIENT_LLM_ERRORS),
+    reraise=True
+)
+def invoke_verification_llm(llm: ChatGroq, messages: List[Any]) -> str:
+    """Send the verification messages to the LLM and return the response text."""
+    return llm.invoke(messages).content.strip()
+
+
 def verify_claim_with_llm(
     llm: ChatGroq,
     claim: str,
@@ -377,26 +747,51 @@ def verify_claim_with_llm(
     
     # Choose appropriate prompt based on claim type
     if claim_type == "financial":
-        user_prompt = FINANCIAL_VERIFICATION_PROMPT.format(
+        user_prompt = build_financial_verification_prompt(
             claim=claim,
             search_results=formatted_results
         )
     else:
-        user_prompt = VERIFICATION_USER_PROMPT.format(
+        user_prompt = build_verification_prompt(
             claim=claim,
             search_results=formatted_results,
             verification_focus=verification_focus or "Verify accuracy of all facts and figures"
         )
     
+    key_source = "\0".join((claim_type, canonicalize_claim(claim), verification_focus, formatted_results))
+    key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+    cached = _verdict_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    
     messages = [
-        SystemMessage(content=VERIFICATION_SYSTEM_PROMPT),
+        VERIFICATION_SYSTEM_MESSAGE,
         HumanMessage(content=user_prompt)
     ]
     
-    response = llm.invoke(messages)
-    response_text = response.content.strip()
-    
-    # Parse response
+    # Once Groq keeps failing after retries (e.g. sustained rate limiting),
+    # the breaker skips the call so remaining claims don't each burn the
+    # retry budget
+    try:
+        response_text = _llm_breaker.call(invoke_verification_llm, llm, messages)
+    except BadRequestError as e:
+        # JSON mode rejects malformed output, but the rejected text usually
+        # still holds a usable verdict for the fallback parsers
+        response_text = failed_json_generation(e)
+        if response_text is None:
+            raise
+    
+    result = parse_verification_response(response_text, search_results)
+    # A failed search (e.g. rate limiting) looks like no results, so verdicts
+    # reached without evidence aren't cached
+    if search_results:
+        ttl = FINANCIAL_VERDICT_CACHE_TTL if claim_type == "financial" else VERDICT_CACHE_TTL
+        _verdict_cache.set(key, result, ttl)
+    return dict(result)
+
+
+def parse_verification_response(response_text: str, search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Parse and normalize the LLM's verification response."""
     result = extract_json_from_text(response_text)
     
     if result:
@@ -447,11 +842,12 @@ def verify_single_claim(claim_data: Dict[str, Any]) -> Dict[str, Any]:
     
     # Step 2: Single smart search (fast)
     # Use the optimized search query from claim extraction
-    search_results = search_web(search_query, max_results=8)
+    cache_ttl = FINANCIAL_SEARCH_CACHE_TTL if claim_type == "financial" else SEARCH_CACHE_TTL
+    search_results = search_web(search_query, max_results=8, cache_ttl=cache_ttl)
     
     # Only do backup search if we got very few results
     if len(search_results) < 2:
-        backup = search_web(claim_text[:80], max_results=5)
+        backup = search_web(claim_text[:80], max_results=5, cache_ttl=cache_ttl)
         search_results.extend(backup)
     
     # Deduplicate
@@ -459,8 +855,9 @@ def verify_single_claim(claim_data: Dict[str, Any]) -> Dict[str, Any]:
     unique_results = []
     for r in search_results:
         url = r.get("url", "")
-        if url and url not in seen:
-            seen.add(url)
+        url_key = normalize_url(url)
+        if url and url_key not in seen:
+            seen.add(url_key)
             unique_results.append(r)
     
     # Step 3: Verify with LLM using search evidence
@@ -488,8 +885,10 @@ def verify_single_claim(claim_data: Dict[str, Any]) -> Dict[str, Any]:
     
     # Extract sources (prioritize LLM sources, fallback to search results)
     llm_sources = verification.get("sources", [])
+    source_urls = set()
     for source in llm_sources[:3]:
         if isinstance(source, dict) and source.get("url"):
+            source_urls.add(normalize_url(str(source["url"])))
             result["sources"].append({
                 "title": source.get("title", "Source"),
                 "url": source.get("url", ""),
@@ -501,7 +900,9 @@ def verify_single_claim(claim_data: Dict[str, Any]) -> Dict[str, Any]:
         for sr in search_results:
             if len(result["sources"]) >= 3:
                 break
-            if sr.get("url") and sr.get("url") not in [s.get("url") for s in result["sources"]]:
+            url_key = normalize_url(sr.get("url", ""))
+            if sr.get("url") and url_key not in source_urls:
+                source_urls.add(url_key)
                 result["sources"].append({
                     "title": sr.get("title", "Source"),
                     "url": sr.get("url", ""),
@@ -511,67 +912,71 @@ def verify_single_claim(claim_data: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def iter_verified_claims(claims: List[Dict[str, Any]]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Verify claims concurrently, yielding (index, result) as each one finishes
+    so callers can show results before the slowest claim is done.
+    """
+    if not claims:
+        return
+    
+    # Claims are independent and network-bound (search + LLM), so verify them
+    # concurrently; results are yielded on the calling thread
+    with ThreadPoolExecutor(max_workers=min(len(claims), MAX_VERIFY_WORKERS)) as executor:
+        futures = {executor.submit(verify_single_claim, claim): i for i, claim in enumerate(claims)}
+        
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                yield i, future.result()
+            except Exception as e:
+                claim = claims[i]
+                yield i, {
+                    "claim": claim.get("claim", ""),
+                    "claim_type": claim.get("claim_type", "unknown"),
+                    "entities": claim.get("entities", []),
+                    "status": "false",
+                    "explanation": f"Could not verify: {str(e)}",
+                    "correct_value": None,
+                    "confidence": "low",
+                    "is_myth": False,
+                    "is_outdated": False,
+                    "sources": []
+                }
+
+
 def verify_claims(
     claims: List[Dict[str, Any]],
     progress_callback=None
 ) -> List[Dict[str, Any]]:
-    """Verify all claims with progress updates."""
-    results = []
+    """Verify all claims with progress updates, returning results in input order."""
+    results = [None] * len(claims)
     total = len(claims)
     
-    for i, claim in enumerate(claims):
-        claim_text = claim.get("claim", "")
-        # Show claim number and preview of the claim text (shorter for same line)
-        preview = claim_text[:50] + "..." if len(claim_text) > 50 else claim_text
+    for done, (i, result) in enumerate(iter_verified_claims(claims), 1):
+        results[i] = result
         
         if progress_callback:
-            progress_callback(i + 1, total, preview)
-        
-        try:
-            result = verify_single_claim(claim)
-            results.append(result)
-            # Add delay so progress bar moves visibly (shorter delay for more claims)
-            time.sleep(0.3)
-        except Exception as e:
-            results.append({
-                "claim": claim_text,
-                "claim_type": claim.get("claim_type", "unknown"),
-                "entities": claim.get("entities", []),
-                "status": "false",
-                "explanation": f"Could not verify: {str(e)}",
-                "correct_value": None,
-                "confidence": "low",
-                "is_myth": False,
-                "is_outdated": False,
-                "sources": []
-            })
+            # Show claim number and preview of the claim text (shorter for same line)
+            claim_text = claims[i].get("claim", "")
+            preview = claim_text[:50] + "..." if len(claim_text) > 50 else claim_text
+            progress_callback(done, total, preview)
     
     return results
 
 
 def get_summary_stats(results: List[Dict[str, Any]]) -> Dict[str, int]:
     """Calculate summary statistics."""
-    stats = {
+    status_counts = Counter(r.get("status", "").lower() for r in results)
+    verified = status_counts["verified"]
+    inaccurate = status_counts["inaccurate"]
+    
+    return {
         "total": len(results),
-        "verified": 0,
-        "inaccurate": 0,
-        "false": 0,
-        "myths_detected": 0,
-        "outdated_detected": 0
+        "verified": verified,
+        "inaccurate": inaccurate,
+        # Any other status counts as false
+        "false": len(results) - verified - inaccurate,
+        "myths_detected": sum(1 for r in results if r.get("is_myth")),
+        "outdated_detected": sum(1 for r in results if r.get("is_outdated"))
     }
-    
-    for r in results:
-        status = r.get("status", "").lower()
-        if status == "verified":
-            stats["verified"] += 1
-        elif status == "inaccurate":
-            stats["inaccurate"] += 1
-        else:
-            stats["false"] += 1
-        
-        if r.get("is_myth"):
-            stats["myths_detected"] += 1
-        if r.get("is_outdated"):
-            stats["outdated_detected"] += 1
-    
-    return stats
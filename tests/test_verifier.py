@@ -0,0 +1,22 @@
+from app.verifier import canonicalize_claim
+
+
+def test_canonicalize_claim_folds_trivial_differences():
+    assert canonicalize_claim("Bitcoin hit $69K!") == canonicalize_claim("bitcoin hit $69,000")
+    assert canonicalize_claim("GDP grew 3.5%.") == canonicalize_claim("gdp grew 3.5%")
+
+
+def test_canonicalize_claim_keeps_numeric_punctuation_distinct():
+    pairs = [
+        ("Revenue fell -5%", "Revenue fell 5%"),
+        ("A ratio of 3:1", "A ratio of 31"),
+        ("About 1/2 of users", "About 12 of users"),
+        ("Margins of 10-20%", "Margins of 1020%"),
+        ("Version 2.0", "Version 20"),
+    ]
+    for first, second in pairs:
+        assert canonicalize_claim(first) != canonicalize_claim(second), (first, second)
+
+
+def test_canonicalize_claim_does_not_join_words_across_punctuation():
+    assert canonicalize_claim("well-known") != canonicalize_claim("wellknown")